@@ -0,0 +1,189 @@
+"""A local stand-in for the Jira REST API, backed by seeded synthetic issues.
+
+Serves just enough of `/rest/api/2` for `jiraport` to run against it:
+`serverInfo`, `field` and offset-paginated `search` with optional expanded
+changelogs. Every response can be delayed, and every Nth request can be
+answered with a 429 to exercise the client's retry path.
+
+Usage: python -m benchmarks.fake_jira --issues 100000 --port 8080
+"""
+
+import json
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+from urllib.parse import parse_qs, urlsplit
+
+import click
+
+from benchmarks.synthetic import issue_at
+
+API = "/rest/api/2/"
+MAX_RESULTS = 100
+
+SERVER_INFO = {
+    "baseUrl": "",
+    "version": "9.12.0",
+    "versionNumbers": [9, 12, 0],
+    "deploymentType": "Server",
+    "serverTitle": "Fake Jira",
+}
+
+FIELDS = [
+    {"id": "created", "name": "Created", "clauseNames": ["created", "createdDate"]},
+    {"id": "status", "name": "Status", "clauseNames": ["status"]},
+]
+
+
+@dataclass
+class FakeJiraConfig:
+    issues: int = 1000
+    seed: int = 0
+    latency: float = 0.0
+    throttle_every: int = 0
+    retry_after: int = 1
+    max_results: int = MAX_RESULTS
+
+
+class FakeJira(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], config: FakeJiraConfig):
+        super().__init__(address, FakeJiraHandler)
+        self.config = config
+        self.requests: Counter[tuple[str, int]] = Counter()
+        self._lock = threading.Lock()
+        self._served = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def should_throttle(self) -> bool:
+        with self._lock:
+            self._served += 1
+            every = self.config.throttle_every
+            return every > 0 and self._served % every == 0
+
+    def record(self, endpoint: str, status: int):
+        with self._lock:
+            self.requests[(endpoint, status)] += 1
+
+    def search(self, params: dict[str, list[str]]) -> dict[str, Any]:
+        config = self.config
+        start_at = int(params.get("startAt", ["0"])[0])
+        max_results = int(params.get("maxResults", [str(config.max_results)])[0])
+        max_results = min(max_results, config.max_results)
+        fields = _split(params.get("fields", []))
+        expand = _split(params.get("expand", []))
+
+        end = min(start_at + max_results, config.issues)
+        issues = [
+            _project(issue_at(n, seed=config.seed), fields, expand)
+            for n in range(start_at, end)
+        ]
+
+        return {
+            "expand": "schema,names",
+            "startAt": start_at,
+            "maxResults": max_results,
+            "total": config.issues,
+            "issues": issues,
+        }
+
+
+class FakeJiraHandler(BaseHTTPRequestHandler):
+    server: FakeJira
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        endpoint = url.path.removeprefix(API)
+
+        if self.server.config.latency:
+            time.sleep(self.server.config.latency)
+
+        if self.server.should_throttle():
+            self._send(429, {"errorMessages": ["Rate limit exceeded."]})
+            return
+
+        if endpoint == "serverInfo":
+            self._send(200, {**SERVER_INFO, "baseUrl": self.server.url})
+        elif endpoint == "field":
+            self._send(200, FIELDS)
+        elif endpoint == "search":
+            self._send(200, self.server.search(parse_qs(url.query)))
+        else:
+            self._send(404, {"errorMessages": [f"Unknown endpoint: {url.path}"]})
+
+    def _send(self, status: int, payload: Any):
+        body = json.dumps(payload).encode()
+        self.server.record(urlsplit(self.path).path.removeprefix(API), status)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 429:
+            self.send_header("Retry-After", str(self.server.config.retry_after))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def serve(config: FakeJiraConfig, port: int = 0) -> Iterator[FakeJira]:
+    """Run a `FakeJira` on a background thread for the duration of the block."""
+
+    server = FakeJira(("127.0.0.1", port), config)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def _split(values: list[str]) -> set[str]:
+    return {part for value in values for part in value.split(",") if part}
+
+
+def _project(issue: dict[str, Any], fields: set[str], expand: set[str]):
+    if fields and "*all" not in fields:
+        issue["fields"] = {k: v for k, v in issue["fields"].items() if k in fields}
+    if "changelog" not in expand:
+        del issue["changelog"]
+    return issue
+
+
+@click.command()
+@click.option("--port", type=int, default=8080)
+@click.option("--issues", type=int, default=FakeJiraConfig.issues)
+@click.option("--seed", type=int, default=FakeJiraConfig.seed)
+@click.option("--latency", type=float, default=0.0, help="Seconds per request")
+@click.option("--throttle-every", type=int, default=0, help="429 every Nth request")
+def main(port, issues, seed, latency, throttle_every):
+    config = FakeJiraConfig(
+        issues=issues, seed=seed, latency=latency, throttle_every=throttle_every
+    )
+
+    with serve(config, port) as server:
+        click.echo(f"Serving {issues} issues at {server.url}. Ctrl-C to stop.")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""End-to-end load test: run the `jiraport` CLI against a `FakeJira` server.
+
+Reports wall time, throughput, the CLI process's memory high-water mark and
+the requests the server saw for each command.
+
+Usage: python -m benchmarks.load_test --issues 100000 --throttle-every 50
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+import click
+import pendulum
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.fake_jira import FakeJira, FakeJiraConfig, serve
+
+ROOT = Path(__file__).resolve().parent.parent
+WEEKLY_START = pendulum.date(2025, 1, 6)
+
+
+@dataclass
+class LoadResult:
+    command: str
+    issues: int
+    seconds: float
+    max_rss: int
+    requests: Counter[tuple[str, int]]
+    returncode: int
+
+
+def run_cli(server: FakeJira, name: str, args: list[str], issues: int) -> LoadResult:
+    before = server.requests.copy()
+
+    with tempfile.TemporaryDirectory() as cwd:
+        started = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-m", "jiraport.main", *args],
+            cwd=cwd,
+            env={
+                **os.environ,
+                "JIRA_SERVER": server.url,
+                "JIRA_EMAIL": "load@example.com",
+                "JIRA_TOKEN": "load",
+                "PYTHONPATH": str(ROOT),
+            },
+            stdout=subprocess.DEVNULL,
+        )
+        _, status, rusage = os.wait4(process.pid, 0)
+        seconds = time.perf_counter() - started
+
+    return LoadResult(
+        command=name,
+        issues=issues,
+        seconds=seconds,
+        # ru_maxrss is in KiB on Linux.
+        max_rss=rusage.ru_maxrss * 1024,
+        requests=server.requests - before,
+        returncode=os.waitstatus_to_exitcode(status),
+    )
+
+
+def _date(date: pendulum.Date) -> str:
+    return date.format("MM/DD/YYYY")
+
+
+def print_results(results: list[LoadResult]):
+    table = Table(title="Load Test")
+    table.add_column("Command", no_wrap=True)
+    table.add_column("Exit", no_wrap=True)
+    table.add_column("Issues", no_wrap=True)
+    table.add_column("Seconds", no_wrap=True)
+    table.add_column("Issues/s", no_wrap=True)
+    table.add_column("Max RSS (MiB)", no_wrap=True)
+    table.add_column("Requests", no_wrap=True)
+    table.add_column("429s", no_wrap=True)
+
+    for result in results:
+        table.add_row(
+            result.command,
+            str(result.returncode),
+            str(result.issues),
+            f"{result.seconds:.2f}",
+            f"{result.issues / result.seconds:.0f}",
+            f"{result.max_rss / 2**20:.1f}",
+            str(result.requests.total()),
+            str(sum(n for (_, code), n in result.requests.items() if code == 429)),
+        )
+
+    Console().print(table)
+
+
+@click.command()
+@click.option("--issues", type=int, default=100000)
+@click.option("--seed", type=int, default=0)
+@click.option("--latency", type=float, default=0.0, help="Seconds per request")
+@click.option("--throttle-every", type=int, default=0, help="429 every Nth request")
+@click.option("--weeks", type=int, default=12, help="Weeks covered by weekly-load")
+def main(issues, seed, latency, throttle_every, weeks):
+    config = FakeJiraConfig(
+        issues=issues, seed=seed, latency=latency, throttle_every=throttle_every
+    )
+
+    weekly_end = WEEKLY_START.add(weeks=weeks - 1)
+
+    with serve(config) as server:
+        results = [
+            run_cli(server, "summarize", ["summarize", "-o", "csv"], issues),
+            run_cli(
+                server,
+                "weekly-load",
+                ["weekly-load", _date(WEEKLY_START), _date(weekly_end)],
+                min(issues, 10) * weeks,
+            ),
+        ]
+
+    print_results(results)
+    sys.exit(max(result.returncode for result in results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Compare `jira.resources.Issue` against `RawIssue` on a synthetic result set.
+
+Usage: python -m benchmarks.raw_issues [COUNT] [SEED]
+"""
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from jira.resources import Issue
+
+from benchmarks.synthetic import generate_issues
+from jiraport import issues
+from jiraport.issues import RawIssue
+
+
+def run(name: str, pages: list[str], build: Callable[[dict[str, Any]], Any]):
+    # Decode inside the measurement, as the client would for each response.
+    def build_all():
+        return [build(data) for page in pages for data in json.loads(page)["issues"]]
+
+    gc.collect()
+    started = time.perf_counter()
+    built = build_all()
+    built_at = time.perf_counter()
+    summaries = [issues.summarize(issue) for issue in built]
+    finished = time.perf_counter()
+
+    del built
+    gc.collect()
+    tracemalloc.start()
+    retained = build_all()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del retained
+
+    print(
+        f"{name:<8} {len(summaries):>8} issues  "
+        f"build {built_at - started:6.2f}s  "
+        f"summarize {finished - built_at:6.2f}s  "
+        f"{len(summaries) / (finished - started):8.0f} issues/s  "
+        f"retained {current / 2**20:7.1f} MiB  "
+        f"peak {peak / 2**20:7.1f} MiB"
+    )
+    return summaries
+
+
+def main(count: int, seed: int):
+    data = list(generate_issues(count, seed=seed))
+    pages = [
+        json.dumps({"issues": data[i : i + 100]}) for i in range(0, len(data), 100)
+    ]
+    del data
+
+    options = {"server": "https://jira.example.com"}
+    resource = run("Issue", pages, lambda data: Issue(options, None, raw=data))
+    raw = run("RawIssue", pages, RawIssue.from_json)
+
+    assert resource == raw, "summaries differ between Issue and RawIssue"
+
+
+if __name__ == "__main__":
+    main(
+        count=int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+        seed=int(sys.argv[2]) if len(sys.argv) > 2 else 0,
+    )
@@ -0,0 +1,106 @@
+"""Seeded generator for Jira search API issue JSON."""
+
+import random
+from typing import Any, Iterator
+
+import pendulum
+
+WORKFLOW = ["To Do", "Development", "Code Review", "QA", "Product Acceptance", "Done"]
+NOISE_FIELDS = ["assignee", "Sprint", "Rank", "description", "labels"]
+START = pendulum.datetime(2025, 1, 1)
+
+
+def generate_issues(
+    count: int, *, seed: int = 0, project: str = "GCM"
+) -> Iterator[dict[str, Any]]:
+    for n in range(count):
+        yield issue_at(n, seed=seed, project=project)
+
+
+def issue_at(n: int, *, seed: int = 0, project: str = "GCM") -> dict[str, Any]:
+    """Return the nth issue for `seed` without generating the ones before it."""
+
+    rng = random.Random(f"{seed}:{n}")
+    return generate_issue(rng, f"{project}-{n + 1}", 10000 + n)
+
+
+def generate_issue(rng: random.Random, key: str, issue_id: int) -> dict[str, Any]:
+    created = START.add(minutes=rng.randrange(365 * 24 * 60))
+    current = created
+    status = WORKFLOW[0]
+    histories = []
+
+    for to_status in WORKFLOW[1 : rng.randint(1, len(WORKFLOW))]:
+        if rng.random() < 0.15:
+            current = current.add(hours=rng.randint(1, 72))
+            histories.append(_history(rng, current, status, "Blocked"))
+            status = "Blocked"
+
+        current = current.add(hours=rng.randint(1, 96))
+        histories.append(_history(rng, current, status, to_status))
+        status = to_status
+
+    return {
+        "expand": "operations,changelog",
+        "id": str(issue_id),
+        "self": f"https://jira.example.com/rest/api/2/issue/{issue_id}",
+        "key": key,
+        "fields": {
+            "created": _timestamp(created),
+            "status": {
+                "self": "https://jira.example.com/rest/api/2/status/1",
+                "description": "",
+                "iconUrl": "https://jira.example.com/images/icons/status.png",
+                "name": status,
+                "id": str(WORKFLOW.index(status) + 1) if status in WORKFLOW else "99",
+                "statusCategory": {"id": 2, "key": "new", "name": "To Do"},
+            },
+        },
+        "changelog": {
+            "startAt": 0,
+            "maxResults": len(histories),
+            "total": len(histories),
+            "histories": histories,
+        },
+    }
+
+
+def _history(
+    rng: random.Random, created: pendulum.DateTime, from_status: str, to_status: str
+) -> dict[str, Any]:
+    items = [
+        {
+            "field": field,
+            "fieldtype": "jira",
+            "from": None,
+            "fromString": None,
+            "to": str(rng.randrange(1000)),
+            "toString": f"{field} {rng.randrange(1000)}",
+        }
+        for field in rng.sample(NOISE_FIELDS, rng.randint(0, 2))
+    ]
+    items.append(
+        {
+            "field": "status",
+            "fieldtype": "jira",
+            "from": "1",
+            "fromString": from_status,
+            "to": "2",
+            "toString": to_status,
+        }
+    )
+
+    return {
+        "id": str(rng.randrange(10**8)),
+        "author": {
+            "accountId": f"user-{rng.randrange(50)}",
+            "displayName": f"User {rng.randrange(50)}",
+            "active": True,
+        },
+        "created": _timestamp(created),
+        "items": items,
+    }
+
+
+def _timestamp(dt: pendulum.DateTime) -> str:
+    return dt.format("YYYY-MM-DDTHH:mm:ss.SSSZZ")
@@ -1,11 +1,10 @@
 from dataclasses import dataclass
+from typing import Any, Iterable, Protocol, Sequence
 from typing_extensions import Optional
 
 import pendulum
 
-from jira.resources import Issue
-
-from jiraport.utils import parse_dt, parse_date
+from jiraport.utils import parse_dt
 
 
 IN_DEV_STATUSES = {
@@ -17,6 +16,121 @@ IN_DEV_STATUSES = {
 }
 
 
+class HistoryItemLike(Protocol):
+    field: str
+    fromString: Optional[str]
+    toString: Optional[str]
+
+
+class HistoryLike(Protocol):
+    created: str
+
+    @property
+    def items(self) -> Iterable[HistoryItemLike]: ...
+
+
+class ChangelogLike(Protocol):
+    @property
+    def histories(self) -> Iterable[HistoryLike]: ...
+
+
+class StatusLike(Protocol):
+    name: str
+
+
+class FieldsLike(Protocol):
+    created: str
+
+    @property
+    def status(self) -> StatusLike: ...
+
+
+class IssueLike(Protocol):
+    """The subset of `jira.resources.Issue` that `summarize` and `status_on` use.
+
+    Satisfied by `jira.resources.Issue`, `RawIssue` and the test factories.
+    """
+
+    key: str
+
+    @property
+    def fields(self) -> FieldsLike: ...
+
+    @property
+    def changelog(self) -> ChangelogLike: ...
+
+
+@dataclass(slots=True)
+class RawStatus:
+    name: str
+
+
+@dataclass(slots=True)
+class RawFields:
+    created: str
+    status: RawStatus
+
+
+@dataclass(slots=True)
+class RawHistoryItem:
+    field: str
+    fromString: Optional[str]
+    toString: Optional[str]
+
+
+@dataclass(slots=True)
+class RawHistory:
+    created: str
+    items: tuple[RawHistoryItem, ...]
+
+
+@dataclass(slots=True)
+class RawChangelog:
+    histories: tuple[RawHistory, ...]
+
+
+@dataclass(slots=True)
+class RawIssue:
+    """A lightweight issue built straight from the search API's JSON.
+
+    Only keeps what `summarize` and `status_on` read, and drops non-status
+    changelog items up front.
+    """
+
+    key: str
+    fields: RawFields
+    changelog: RawChangelog
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "RawIssue":
+        fields = data["fields"]
+        status = fields.get("status") or {}
+        histories = (data.get("changelog") or {}).get("histories", [])
+
+        return cls(
+            key=data["key"],
+            fields=RawFields(
+                created=fields["created"],
+                status=RawStatus(status.get("name", "")),
+            ),
+            changelog=RawChangelog(
+                tuple(
+                    RawHistory(
+                        created=history["created"],
+                        items=tuple(
+                            RawHistoryItem(
+                                "status", item.get("fromString"), item.get("toString")
+                            )
+                            for item in history["items"]
+                            if item["field"] == "status"
+                        ),
+                    )
+                    for history in histories
+                )
+            ),
+        )
+
+
 @dataclass
 class IssueSummary:
     id: str
@@ -32,7 +146,7 @@ class IssueSummary:
     date_done: Optional[pendulum.DateTime]
 
 
-def summarize(issue: Issue) -> IssueSummary:
+def summarize(issue: IssueLike) -> IssueSummary:
     story_points = ""
     time_blocked = pendulum.Duration()
     time_dev = pendulum.Duration()
@@ -44,9 +158,8 @@ def summarize(issue: Issue) -> IssueSummary:
     date_code_review = None
     date_done = None
 
-    for history in sorted(issue.changelog.histories, key=_created):
+    for date_current, history in _dated_histories(issue):
         status_items = [item for item in history.items if item.field == "status"]
-        date_current = parse_dt(history.created)
 
         for item in status_items:
             # Track total blocked time.
@@ -87,13 +200,11 @@ def summarize(issue: Issue) -> IssueSummary:
     )
 
 
-def status_on(issue: Issue, date: pendulum.Date) -> str:
+def status_on(issue: IssueLike, date: pendulum.Date) -> str:
     status = "Created"
 
-    for history in sorted(issue.changelog.histories, key=_created):
-        date_current = parse_date(history.created)
-
-        if date_current >= date:
+    for date_current, history in _dated_histories(issue):
+        if date_current.date() >= date:
             break
 
         status_items = [item for item in history.items if item.field == "status"]
@@ -104,5 +215,34 @@ def status_on(issue: Issue, date: pendulum.Date) -> str:
     return status
 
 
-def _created(issue_history):
-    return pendulum.parse(issue_history.created)
+def statuses_on(issue: IssueLike, dates: Sequence[pendulum.Date]) -> list[str]:
+    """`status_on` for each of `dates`, in ascending order, in a single pass."""
+
+    changes = [(dt.date(), history) for dt, history in _dated_histories(issue)]
+    statuses = []
+    status = "Created"
+    i = 0
+
+    for date in dates:
+        if i == len(changes):
+            # No changes left, so every remaining date has the same status.
+            statuses.extend([status] * (len(dates) - len(statuses)))
+            break
+
+        while i < len(changes) and changes[i][0] < date:
+            for item in changes[i][1].items:
+                if item.field == "status":
+                    status = item.toString
+            i += 1
+
+        statuses.append(status)
+
+    return statuses
+
+
+def _dated_histories(issue: IssueLike) -> list[tuple[pendulum.DateTime, HistoryLike]]:
+    # Parse each timestamp once and sort on the parsed value.
+    dated = [
+        (parse_dt(history.created), history) for history in issue.changelog.histories
+    ]
+    return sorted(dated, key=lambda pair: pair[0])
@@ -1,12 +1,27 @@
+import math
+import random
+from pathlib import Path
+
 import click
+import pendulum
 from jira import JIRA
 
 from pendulum import Date
 
 from jiraport import issues
 from jiraport.click_utils import DateParamtype
-from jiraport.output import print_table, write_csv
-from jiraport.utils import week_intervals
+from jiraport.output import (
+    print_estimates,
+    print_history,
+    print_status_counts,
+    print_table,
+    write_csv,
+    write_estimates_csv,
+)
+from jiraport.sampling import estimate
+from jiraport.search import SearchError, count, sample_pages, search_raw
+from jiraport.snapshot import SnapshotError, StatusMatrix
+from jiraport.utils import TZ, week_intervals
 
 DEFAULT_JQL = """
 type = Story AND status = Done AND project = GCM AND
@@ -19,19 +34,16 @@ labels NOT IN (Cadent)
 @click.option(
     "--server",
     envvar="JIRA_SERVER",
-    required=True,
     help="can also be set via JIRA_SERVER env var",
 )
 @click.option(
     "--email",
     envvar="JIRA_EMAIL",
-    required=True,
     help="can also be set via JIRA_EMAIL env var",
 )
 @click.option(
     "--token",
     envvar="JIRA_TOKEN",
-    required=True,
     help="can also be set via JIRA_TOKEN env var",
 )
 @click.pass_context
@@ -54,19 +66,37 @@ def cli(ctx, server, email, token):
     default=["table", "csv"],
     help="Output format. Accepted: csv, table",
 )
+@click.option(
+    "--sample",
+    type=click.IntRange(min=1),
+    help="Estimate from a random sample of about this many issues",
+)
+@click.option(
+    "--sample-fraction",
+    type=click.FloatRange(min=0, max=1, min_open=True),
+    help="Estimate from a random sample of this fraction of issues",
+)
+@click.option("--seed", type=int, help="Random seed for --sample. Default: random")
 @click.pass_context
-def summarize(ctx, jql, limit, output):
+def summarize(ctx, jql, limit, output, sample, sample_fraction, seed):
     """Summarize JIRA issues matching the given JQL query."""
 
+    sampling = sample is not None or sample_fraction is not None
+    if sample is not None and sample_fraction is not None:
+        raise click.UsageError("--sample and --sample-fraction are mutually exclusive")
+    if sampling and limit is not None:
+        raise click.UsageError("--limit cannot be combined with sampling")
+
     j = _jira_connect(**ctx.obj["jira_config"])
 
     click.echo("Searching with JQL:")
     click.echo(f"{jql}\n")
 
-    limit = False if limit is None else limit
-    jira_issues = j.search_issues(
-        jql, maxResults=limit, expand="changelog", fields="id,created"
-    )
+    if sampling:
+        _summarize_sample(j, jql, sample, sample_fraction, random.Random(seed), output)
+        return
+
+    jira_issues = search_raw(j, jql, limit=limit)
 
     click.echo(f"Found {len(jira_issues)} issues. Summarizing...")
     summaries = [issues.summarize(issue) for issue in jira_issues]
@@ -79,6 +109,34 @@ def summarize(ctx, jql, limit, output):
         click.echo("CSV output written to output.csv")
 
 
+def _summarize_sample(
+    j: JIRA, jql, sample, sample_fraction, rng: random.Random, output
+):
+    try:
+        total = count(j, jql)
+        size = sample or math.ceil(total * sample_fraction)
+        pages = sample_pages(j, jql, total, size, rng=rng)
+    except SearchError as e:
+        raise click.ClickException(str(e))
+
+    sampled = sum(len(page) for page in pages)
+    click.echo(f"Found {total} issues. Summarizing a sample of {sampled}...")
+
+    summaries = [[issues.summarize(issue) for issue in page] for page in pages]
+    estimates = estimate(summaries, rng=rng)
+
+    if not estimates:
+        click.echo("No issues to estimate from.")
+        return
+
+    if "table" in output:
+        print_estimates(estimates, sampled, total)
+
+    if "csv" in output:
+        write_estimates_csv(estimates)
+        click.echo("CSV output written to output.csv")
+
+
 @cli.command()
 @click.argument("start_date", type=DateParamtype())
 @click.argument("end_date", type=DateParamtype())
@@ -92,15 +150,123 @@ def weekly_load(ctx, start_date: Date, end_date: Date):
             status CHANGED TO 'Development' during ({start_date}, {end_date})
         """
 
-        jira_issues = j.search_issues(
-            jql, maxResults=10, expand="changelog", fields="id,created"
-        )
+        jira_issues = search_raw(j, jql, limit=10)
 
         for issue in jira_issues:
             print(issues.status_on(issue, i_start))
 
 
+@cli.group()
+def snapshot():
+    """Materialized issue x day status matrix, stored on disk."""
+
+
+snapshot_path = click.option(
+    "--path",
+    type=click.Path(file_okay=False, path_type=Path),
+    default="snapshot",
+    help="Snapshot directory. Default: ./snapshot",
+)
+
+
+@snapshot.command()
+@click.option(
+    "--jql", help="JQL query. Default: the snapshot's, or the summarize default"
+)
+@click.option("--start", type=DateParamtype(), help="First day of a new snapshot")
+@click.option("--end", type=DateParamtype(), help="Last day to fill in. Default: today")
+@snapshot_path
+@click.pass_context
+def update(ctx, jql, start: Date | None, end: Date | None, path: Path):
+    """Create a snapshot, or extend an existing one through END."""
+
+    end = end or pendulum.today(TZ).date()
+
+    matrix = None
+
+    if StatusMatrix.exists(path):
+        matrix = _open_snapshot(path)
+        if jql and jql != matrix.jql:
+            raise click.UsageError(f"Snapshot at {path} was built with a different JQL")
+        if start and start != matrix.start:
+            raise click.UsageError(f"Snapshot at {path} starts on {matrix.start}")
+    elif start is None:
+        raise click.UsageError("--start is required for a new snapshot")
+
+    j = _jira_connect(**ctx.obj["jira_config"])
+
+    if matrix is None:
+        matrix = StatusMatrix.create(path, jql or DEFAULT_JQL.strip(), start)
+
+    with matrix:
+        click.echo("Searching with JQL:")
+        click.echo(f"{matrix.jql}\n")
+
+        jira_issues = search_raw(j, matrix.jql)
+
+        click.echo(f"Found {len(jira_issues)} issues. Updating snapshot...")
+        try:
+            matrix.update(jira_issues, end)
+        except SnapshotError as e:
+            raise click.ClickException(str(e))
+
+        click.echo(
+            f"Snapshot at {path} covers {len(matrix.keys)} issues "
+            f"from {matrix.start} to {matrix.end}."
+        )
+
+
+@snapshot.command()
+@click.option(
+    "--start", type=DateParamtype(), help="Default: first day of the snapshot"
+)
+@click.option("--end", type=DateParamtype(), help="Default: last day of the snapshot")
+@snapshot_path
+def counts(start: Date | None, end: Date | None, path: Path):
+    """Count issues in each status on each day."""
+
+    with _open_snapshot(path) as matrix:
+        first = max(matrix.day(start), 0) if start else 0
+        last = min(matrix.day(end) + 1, matrix.days) if end else matrix.days
+        dates = matrix.dates(first, last)
+
+        print_status_counts(
+            dates, matrix.statuses, [matrix.counts(day) for day in range(first, last)]
+        )
+
+
+@snapshot.command()
+@click.argument("key")
+@snapshot_path
+def history(key: str, path: Path):
+    """Show the status of a single issue over the snapshot's days."""
+
+    with _open_snapshot(path) as matrix:
+        try:
+            statuses = matrix.history(key)
+        except SnapshotError as e:
+            raise click.ClickException(str(e))
+
+        print_history(key, matrix.dates(), statuses)
+
+
+def _open_snapshot(path: Path) -> StatusMatrix:
+    try:
+        return StatusMatrix.open(path)
+    except SnapshotError as e:
+        raise click.ClickException(str(e))
+
+
 def _jira_connect(*, server, email, token) -> JIRA:
+    # Only commands that talk to Jira need credentials; snapshot queries don't.
+    missing = [
+        f"--{name}"
+        for name, value in (("server", server), ("email", email), ("token", token))
+        if not value
+    ]
+    if missing:
+        raise click.UsageError(f"Missing option(s): {', '.join(missing)}")
+
     click.echo("Connecting to JIRA server...", nl=False)
     j = JIRA(server=server, basic_auth=(email, token))
     click.echo("done.\n")
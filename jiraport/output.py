@@ -1,9 +1,11 @@
 import csv
 
+from pendulum import Date
 from rich.console import Console
 from rich.table import Table
 
 from jiraport import issues
+from jiraport.sampling import Estimate
 from jiraport.utils import half_days, hr_date
 
 
@@ -40,8 +42,50 @@ def print_table(summaries: list[issues.IssueSummary]):
     console.print(table)
 
 
+def print_estimates(estimates: list[Estimate], sampled: int, total: int):
+    table = Table(title=f"Estimates from {sampled} of {total} Issues")
+    table.add_column("Metric", no_wrap=True)
+    table.add_column("Statistic", no_wrap=True)
+    table.add_column("Estimate", no_wrap=True, justify="right")
+    table.add_column("95% CI", no_wrap=True, justify="right")
+
+    for estimate in estimates:
+        table.add_row(
+            estimate.metric,
+            estimate.statistic,
+            f"{estimate.value:.1f}",
+            _interval(estimate),
+        )
+
+    Console().print(table)
+
+
+def write_estimates_csv(estimates: list[Estimate]):
+    _write_rows(
+        [
+            {
+                "Metric": estimate.metric,
+                "Statistic": estimate.statistic,
+                "Estimate": f"{estimate.value:.1f}",
+                "95% CI": _interval(estimate),
+            }
+            for estimate in estimates
+        ]
+    )
+
+
+def _interval(estimate: Estimate) -> str:
+    if estimate.low is None or estimate.high is None:
+        return "n/a"
+
+    return f"{estimate.low:.1f} - {estimate.high:.1f}"
+
+
 def write_csv(summaries: list[issues.IssueSummary]):
-    rows = [to_csv_row(summary) for summary in summaries]
+    _write_rows([to_csv_row(summary) for summary in summaries])
+
+
+def _write_rows(rows: list[dict]):
     fieldnames = rows[0].keys()
 
     with open("output.csv", "w") as file:
@@ -63,3 +107,38 @@ def to_csv_row(summary: issues.IssueSummary):
         "Days In Dev + Blocked": half_days(summary.time_dev)
         + half_days(summary.time_blocked),
     }
+
+
+def print_status_counts(
+    dates: list[Date], statuses: list[str], counts: list[dict[str, int]]
+):
+    statuses = [status for status in statuses if any(status in day for day in counts)]
+
+    table = Table(title="Issues per Status")
+    table.add_column("Date", no_wrap=True)
+    for status in statuses:
+        table.add_column(status, no_wrap=True, justify="right")
+
+    for date, day in zip(dates, counts):
+        table.add_row(hr_date(date), *(str(day.get(status, 0)) for status in statuses))
+
+    Console().print(table)
+
+
+def print_history(key: str, dates: list[Date], statuses: list[str]):
+    table = Table(title=f"{key} History")
+    table.add_column("From", no_wrap=True)
+    table.add_column("To", no_wrap=True)
+    table.add_column("Status", no_wrap=True)
+
+    run_start = 0
+    for i in range(1, len(statuses) + 1):
+        if i == len(statuses) or statuses[i] != statuses[run_start]:
+            table.add_row(
+                hr_date(dates[run_start]),
+                hr_date(dates[i - 1]),
+                statuses[run_start] or "No status",
+            )
+            run_start = i
+
+    Console().print(table)
@@ -0,0 +1,92 @@
+import random
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import pendulum
+
+from jiraport.issues import IssueSummary
+from jiraport.utils import half_days
+
+CONFIDENCE = 0.95
+RESAMPLES = 1000
+
+METRICS: dict[str, Callable[[IssueSummary], pendulum.Duration]] = {
+    "Days In Dev": lambda summary: summary.time_dev,
+    "Days Blocked": lambda summary: summary.time_blocked,
+}
+
+
+@dataclass
+class Estimate:
+    metric: str
+    statistic: str
+    value: float
+    low: Optional[float]
+    high: Optional[float]
+
+
+def estimate(
+    pages: list[list[IssueSummary]],
+    *,
+    rng: random.Random,
+    resamples: int = RESAMPLES,
+    confidence: float = CONFIDENCE,
+) -> list[Estimate]:
+    """Estimate mean, median and p90 of each metric from sampled result pages.
+
+    Values are rounded with `half_days`, as in the exact report. Confidence
+    intervals come from a bootstrap that resamples whole pages, since issues
+    on the same page tend to be alike. A single page is resampled issue by
+    issue instead, and with fewer than two issues there is no interval.
+    """
+
+    pages = [page for page in pages if page]
+    estimates = []
+
+    if not pages:
+        return estimates
+
+    if len(pages) == 1:
+        pages = [[summary] for summary in pages[0]]
+
+    for metric, duration in METRICS.items():
+        values = [[float(half_days(duration(s))) for s in page] for page in pages]
+        point = _statistics(sorted(v for page in values for v in page))
+
+        replicates: list[list[float]] = [[] for _ in point]
+        for _ in range(resamples if len(values) > 1 else 0):
+            chosen = rng.choices(values, k=len(values))
+            stats = _statistics(sorted(v for page in chosen for v in page))
+            for replicate, stat in zip(replicates, stats.values()):
+                replicate.append(stat)
+
+        alpha = (1 - confidence) / 2
+        for (statistic, value), replicate in zip(point.items(), replicates):
+            replicate.sort()
+            estimates.append(
+                Estimate(
+                    metric=metric,
+                    statistic=statistic,
+                    value=value,
+                    low=_percentile(replicate, alpha) if replicate else None,
+                    high=_percentile(replicate, 1 - alpha) if replicate else None,
+                )
+            )
+
+    return estimates
+
+
+def _statistics(values: list[float]) -> dict[str, float]:
+    return {
+        "Mean": sum(values) / len(values),
+        "Median": _percentile(values, 0.5),
+        "P90": _percentile(values, 0.9),
+    }
+
+
+def _percentile(values: list[float], q: float) -> float:
+    # Linear interpolation between closest ranks; `values` must be sorted.
+    position = (len(values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
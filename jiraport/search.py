@@ -0,0 +1,148 @@
+import math
+import random
+from typing import Any, Iterator, Optional
+
+from jira import JIRA
+
+from jiraport.issues import RawIssue
+
+PAGE_SIZE = 100
+RAW_FIELDS = "id,created,status"
+
+# Spread a sample over at least this many pages, down to one issue per page.
+SAMPLE_PAGES = 30
+
+
+class SearchError(Exception):
+    pass
+
+
+def search_raw(
+    j: JIRA,
+    jql: str,
+    *,
+    limit: Optional[int] = None,
+    fields: str = RAW_FIELDS,
+    page_size: int = PAGE_SIZE,
+) -> list[RawIssue]:
+    """Search for issues without building `jira.resources.Issue` objects.
+
+    Pages through the search API as JSON and converts each issue to a
+    `RawIssue`, which `issues.summarize` and `issues.status_on` accept.
+    """
+
+    return list(iter_raw(j, jql, limit=limit, fields=fields, page_size=page_size))
+
+
+def iter_raw(
+    j: JIRA,
+    jql: str,
+    *,
+    limit: Optional[int] = None,
+    fields: str = RAW_FIELDS,
+    page_size: int = PAGE_SIZE,
+) -> Iterator[RawIssue]:
+    count = 0
+
+    if limit is not None:
+        if limit <= 0:
+            return
+        page_size = min(page_size, limit)
+
+    for page in _pages(j, jql, fields=fields, page_size=page_size):
+        for data in page["issues"]:
+            yield RawIssue.from_json(data)
+            count += 1
+
+            if count == limit:
+                return
+
+
+def count(j: JIRA, jql: str) -> int:
+    page = j.search_issues(jql, maxResults=1, fields="id", json_result=True)
+
+    if "total" not in page:
+        # Jira Cloud's token-paginated search reports no total and has no offsets.
+        raise SearchError("Jira Cloud searches cannot be counted or sampled by offset")
+
+    return page["total"]
+
+
+def sample_pages(
+    j: JIRA,
+    jql: str,
+    total: int,
+    size: int,
+    *,
+    rng: random.Random,
+    fields: str = RAW_FIELDS,
+) -> list[list[RawIssue]]:
+    """Fetch a random spread of result pages holding roughly `size` of `total` issues.
+
+    Pages, rather than single issues, are sampled so each request stays
+    useful; the page size shrinks for small samples so they still span about
+    `SAMPLE_PAGES` pages, which the bootstrap in `sampling` relies on.
+    """
+
+    page_size = min(PAGE_SIZE, max(1, size // SAMPLE_PAGES))
+    pages = math.ceil(total / page_size)
+    chosen = rng.sample(range(pages), min(pages, math.ceil(size / page_size)))
+
+    return [
+        [
+            RawIssue.from_json(data)
+            for data in _search_page(
+                j, jql, page * page_size, fields=fields, page_size=page_size
+            )["issues"]
+        ]
+        for page in sorted(chosen)
+    ]
+
+
+def _pages(
+    j: JIRA, jql: str, *, fields: str, page_size: int
+) -> Iterator[dict[str, Any]]:
+    page = j.search_issues(
+        jql, maxResults=page_size, expand="changelog", fields=fields, json_result=True
+    )
+    yield page
+
+    if "total" in page:
+        yield from _offset_pages(j, jql, page, fields=fields, page_size=page_size)
+        return
+
+    # Jira Cloud paginates with an opaque token instead of offsets.
+    while page.get("nextPageToken"):
+        page = j.enhanced_search_issues(
+            jql,
+            nextPageToken=page["nextPageToken"],
+            maxResults=page_size,
+            expand="changelog",
+            fields=fields,
+            json_result=True,
+        )
+        yield page
+
+
+def _offset_pages(
+    j: JIRA, jql: str, page: dict[str, Any], *, fields: str, page_size: int
+) -> Iterator[dict[str, Any]]:
+    start_at = page["startAt"] + len(page["issues"])
+
+    while page["issues"] and start_at < page["total"]:
+        page = _search_page(j, jql, start_at, fields=fields, page_size=page_size)
+        yield page
+        start_at += len(page["issues"])
+
+
+def _search_page(
+    j: JIRA, jql: str, start_at: int, *, fields: str, page_size: int
+) -> dict[str, Any]:
+    return j.search_issues(
+        jql,
+        startAt=start_at,
+        maxResults=page_size,
+        expand="changelog",
+        fields=fields,
+        json_result=True,
+    )
@@ -0,0 +1,291 @@
+import json
+import mmap
+import os
+from bisect import bisect_left
+from pathlib import Path
+from typing import Iterable, Optional
+
+import pendulum
+from pendulum import Date
+
+from jiraport import issues
+from jiraport.utils import parse_date
+
+MATRIX_FILE = "matrix-{capacity}.bin"
+INDEX_FILE = "index.json"
+VERSION = 1
+
+# Code 0 marks a day with no known status: before the issue was created, or
+# after it left the JQL results.
+UNKNOWN = ""
+MAX_STATUSES = 256
+MIN_CAPACITY = 1024
+
+
+class SnapshotError(Exception):
+    pass
+
+
+class StatusMatrix:
+    """A dense issue x day matrix of status codes, memory-mapped from disk.
+
+    The matrix is stored day-major, one byte per issue, with each day's row
+    padded to `capacity` issues. Appending days or adding issues within
+    capacity only touches the new cells; the key and status dictionaries
+    live in a JSON index next to the matrix.
+
+    The index is the commit point. Days an interrupted update appended past
+    the indexed ones are cut off on open, and widening writes a new matrix
+    file that only replaces the old one once the index names it.
+    """
+
+    def __init__(self, path: Path, index: dict):
+        self.path = path
+        self.jql: str = index["jql"]
+        self.start: Date = pendulum.parse(index["start"]).date()  # type: ignore
+        self.days: int = index["days"]
+        self.capacity: int = index["capacity"]
+        self.matrix_file: str = index["matrix"]
+        self.keys: list[str] = index["keys"]
+        self.statuses: list[str] = index["statuses"]
+
+        self._key_index = {key: i for i, key in enumerate(self.keys)}
+        self._status_codes = {status: i for i, status in enumerate(self.statuses)}
+        self._file = open(path / self.matrix_file, "r+b")
+        self._mm: Optional[mmap.mmap] = None
+
+        size = self.days * self.capacity
+        if self._size() < size:
+            self._file.close()
+            raise SnapshotError(
+                f"Snapshot at {path} is shorter than its index; rebuild it"
+            )
+        if self._size() > size:
+            self._file.truncate(size)
+
+        self._map()
+
+    @classmethod
+    def create(cls, path: Path, jql: str, start: Date) -> "StatusMatrix":
+        matrix_file = MATRIX_FILE.format(capacity=MIN_CAPACITY)
+        path.mkdir(parents=True, exist_ok=True)
+        (path / matrix_file).write_bytes(b"")
+        index = {
+            "version": VERSION,
+            "jql": jql,
+            "start": start.isoformat(),
+            "days": 0,
+            "capacity": MIN_CAPACITY,
+            "matrix": matrix_file,
+            "keys": [],
+            "statuses": [UNKNOWN],
+        }
+        _write_index(path, index)
+        return cls(path, index)
+
+    @classmethod
+    def open(cls, path: Path) -> "StatusMatrix":
+        try:
+            index = json.loads((path / INDEX_FILE).read_text())
+        except FileNotFoundError:
+            raise SnapshotError(f"No snapshot found at {path}")
+
+        if index.get("version") != VERSION:
+            raise SnapshotError(f"Unsupported snapshot version in {path}")
+
+        return cls(path, index)
+
+    @classmethod
+    def exists(cls, path: Path) -> bool:
+        return (path / INDEX_FILE).exists()
+
+    @property
+    def end(self) -> Date:
+        return self.start.add(days=self.days - 1)
+
+    def dates(self, first: int = 0, last: Optional[int] = None) -> list[Date]:
+        last = self.days if last is None else last
+        return [self.start.add(days=day) for day in range(first, last)]
+
+    def day(self, date: Date) -> int:
+        return (date - self.start).days
+
+    def update(self, jira_issues: Iterable[issues.IssueLike], end: Date):
+        """Extend the matrix through `end` and fill in cells from `jira_issues`.
+
+        Issues already in the matrix only get the new days computed; issues
+        seen for the first time get every day. Days before an issue was
+        created, and days for known issues missing from `jira_issues`, are
+        left unknown.
+        """
+
+        jira_issues = list(jira_issues)
+        first_new_day = self.days
+        days = max(self.days, self.day(end) + 1)
+        dates = self.dates(last=days)
+
+        # Widen before adding days, so a widened matrix is committed on its own.
+        new_keys = {issue.key for issue in jira_issues} - self._key_index.keys()
+        capacity = self.capacity
+        while len(self.keys) + len(new_keys) > capacity:
+            capacity *= 2
+        if capacity != self.capacity:
+            self._widen(capacity)
+
+        if days > self.days:
+            self._unmap()
+            self._file.truncate(days * self.capacity)
+            self._map()
+            self.days = days
+
+        for issue in jira_issues:
+            first = first_new_day if issue.key in self._key_index else 0
+            if first == days:
+                continue
+
+            column = self._add_key(issue.key)
+            issue_dates = dates[first:]
+            created = bisect_left(issue_dates, parse_date(issue.fields.created))
+            statuses = issues.statuses_on(issue, issue_dates[created:])
+            codes = [0] * created + [self._status_code(s) for s in statuses]
+            self._write_column(column, first, codes)
+
+        self.flush()
+
+    def counts(self, day: int) -> dict[str, int]:
+        row = self._row(day)
+        counts = {}
+
+        for code, status in enumerate(self.statuses):
+            if code == 0:
+                continue
+
+            count = row.count(code)
+            if count:
+                counts[status] = count
+
+        return counts
+
+    def history(self, key: str) -> list[str]:
+        try:
+            column = self._key_index[key]
+        except KeyError:
+            raise SnapshotError(f"{key} is not in the snapshot")
+
+        if self._mm is None:
+            return []
+
+        codes = self._mm[column : self.days * self.capacity : self.capacity]
+        return [self.statuses[code] for code in codes]
+
+    def flush(self):
+        if self._mm is not None:
+            self._mm.flush()
+
+        _write_index(
+            self.path,
+            {
+                "version": VERSION,
+                "jql": self.jql,
+                "start": self.start.isoformat(),
+                "days": self.days,
+                "capacity": self.capacity,
+                "matrix": self.matrix_file,
+                "keys": self.keys,
+                "statuses": self.statuses,
+            },
+        )
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _row(self, day: int) -> bytes:
+        if not 0 <= day < self.days or self._mm is None:
+            raise SnapshotError(f"Day {day} is outside the snapshot")
+
+        offset = day * self.capacity
+        return self._mm[offset : offset + len(self.keys)]
+
+    def _write_column(self, column: int, first: int, codes: list[int]):
+        assert self._mm is not None
+
+        mm = self._mm
+        offset = first * self.capacity + column
+
+        for code in codes:
+            mm[offset] = code
+            offset += self.capacity
+
+    def _add_key(self, key: str) -> int:
+        if key in self._key_index:
+            return self._key_index[key]
+
+        assert len(self.keys) < self.capacity
+
+        self._key_index[key] = len(self.keys)
+        self.keys.append(key)
+        return self._key_index[key]
+
+    def _status_code(self, status: str) -> int:
+        if status in self._status_codes:
+            return self._status_codes[status]
+
+        if len(self.statuses) == MAX_STATUSES:
+            raise SnapshotError(f"Too many statuses; cannot add {status!r}")
+
+        self._status_codes[status] = len(self.statuses)
+        self.statuses.append(status)
+        return self._status_codes[status]
+
+    def _widen(self, capacity: int):
+        # Write the matrix in the new layout to a file of its own and commit it
+        # to the index; the old file is only removed once nothing names it.
+        old_file = self.matrix_file
+        matrix_file = MATRIX_FILE.format(capacity=capacity)
+        padding = bytes(capacity - self.capacity)
+
+        with open(self.path / matrix_file, "wb") as file:
+            if self._mm is not None:
+                for day in range(self.days):
+                    offset = day * self.capacity
+                    file.write(self._mm[offset : offset + self.capacity] + padding)
+            file.flush()
+            os.fsync(file.fileno())
+
+        self.capacity = capacity
+        self.matrix_file = matrix_file
+        self.flush()
+
+        self._unmap()
+        self._file.close()
+        self._file = open(self.path / matrix_file, "r+b")
+        self._map()
+        os.remove(self.path / old_file)
+
+    def _size(self) -> int:
+        return os.fstat(self._file.fileno()).st_size
+
+    def _map(self):
+        size = self._size()
+        self._mm = mmap.mmap(self._file.fileno(), size) if size else None
+
+    def _unmap(self):
+        if self._mm is not None:
+            self._mm.flush()
+            self._mm.close()
+            self._mm = None
+
+
+def _write_index(path: Path, index: dict):
+    tmp = path / f"{INDEX_FILE}.tmp"
+    tmp.write_text(json.dumps(index))
+    os.replace(tmp, path / INDEX_FILE)
@@ -0,0 +1,50 @@
+"""Tests for the local fake Jira server used by the load test."""
+
+import pytest
+import requests
+from jira import JIRA
+
+from benchmarks.fake_jira import FakeJiraConfig, serve
+from jiraport import issues
+from jiraport.search import search_raw
+
+
+@pytest.fixture
+def fake_jira():
+    with serve(FakeJiraConfig(issues=250, seed=7)) as server:
+        yield server
+
+
+def test_search_raw_against_fake_jira(fake_jira):
+    j = JIRA(server=fake_jira.url, basic_auth=("test", "test"))
+
+    jira_issues = search_raw(j, "project = GCM")
+
+    assert [issue.key for issue in jira_issues] == [f"GCM-{n}" for n in range(1, 251)]
+    assert fake_jira.requests[("search", 200)] == 3
+    assert all(issues.summarize(issue) for issue in jira_issues)
+
+
+def test_search_is_deterministic_for_a_seed(fake_jira):
+    url = f"{fake_jira.url}/rest/api/2/search"
+    params = {"startAt": 100, "maxResults": 5, "expand": "changelog"}
+
+    first = requests.get(url, params=params).json()
+    second = requests.get(url, params=params).json()
+
+    assert first == second
+    assert first["total"] == 250
+    assert [issue["key"] for issue in first["issues"]] == [
+        f"GCM-{n}" for n in range(101, 106)
+    ]
+
+
+def test_throttles_every_nth_request():
+    config = FakeJiraConfig(issues=10, throttle_every=2, retry_after=3)
+
+    with serve(config) as server:
+        url = f"{server.url}/rest/api/2/search"
+        responses = [requests.get(url) for _ in range(4)]
+
+    assert [r.status_code for r in responses] == [200, 429, 200, 429]
+    assert responses[1].headers["Retry-After"] == "3"
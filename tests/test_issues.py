@@ -3,7 +3,7 @@
 import pytest
 import pendulum
 
-from jiraport.issues import summarize, status_on, IssueSummary
+from jiraport.issues import summarize, status_on, statuses_on, IssueSummary, RawIssue
 from .factories import (
     IssueFactory,
     MockStatus,
@@ -159,3 +159,83 @@ class TestStatusOn:
     def test_status_after_done(self, issue):
         assert status_on(issue, DT_CREATED.add(days=7).date()) == "Done"
         assert status_on(issue, DT_CREATED.add(years=10).date()) == "Done"
+
+    def test_statuses_on_matches_status_on(self, issue):
+        dates = [DT_CREATED.add(days=n).date() for n in range(-2, 10)]
+
+        assert statuses_on(issue, dates) == [status_on(issue, d) for d in dates]
+
+    def test_statuses_on_without_history(self):
+        issue = IssueFactory(created=DT_CREATED.to_iso8601_string())
+        dates = [DT_CREATED.add(days=n).date() for n in range(3)]
+
+        assert statuses_on(issue, dates) == ["Created"] * 3
+
+
+class TestRawIssue:
+    @pytest.fixture
+    def data(self):
+        return {
+            "key": "TEST-789",
+            "fields": {
+                "created": DT_CREATED.to_iso8601_string(),
+                "status": {"name": "Done", "id": "6"},
+            },
+            "changelog": {
+                "histories": [
+                    {
+                        "created": DT_CREATED.add(days=5).to_iso8601_string(),
+                        "items": [
+                            {"field": "assignee", "fromString": None, "toString": "A"},
+                            {
+                                "field": "status",
+                                "fromString": "Development",
+                                "toString": "Done",
+                            },
+                        ],
+                    },
+                    {
+                        "created": DT_CREATED.add(days=2).to_iso8601_string(),
+                        "items": [
+                            {
+                                "field": "status",
+                                "fromString": "To Do",
+                                "toString": "Development",
+                            }
+                        ],
+                    },
+                ]
+            },
+        }
+
+    def test_from_json_keeps_only_status_items(self, data):
+        issue = RawIssue.from_json(data)
+
+        assert issue.key == "TEST-789"
+        assert issue.fields.status.name == "Done"
+        assert [len(history.items) for history in issue.changelog.histories] == [1, 1]
+
+    def test_from_json_without_changelog(self, data):
+        del data["changelog"]
+
+        assert RawIssue.from_json(data).changelog.histories == ()
+
+    def test_summarize_raw_issue(self, data):
+        assert summarize(RawIssue.from_json(data)) == IssueSummary(
+            id="TEST-789",
+            status="Done",
+            story_points="",
+            date_created=DT_CREATED,
+            date_in_dev=DT_CREATED.add(days=2),
+            date_code_review=None,
+            date_done=DT_CREATED.add(days=5),
+            time_dev=pendulum.Duration(days=3),
+            time_blocked=DURATION_NONE,
+        )
+
+    def test_status_on_raw_issue(self, data):
+        issue = RawIssue.from_json(data)
+
+        assert status_on(issue, DT_CREATED.add(days=1).date()) == "Created"
+        assert status_on(issue, DT_CREATED.add(days=3).date()) == "Development"
+        assert status_on(issue, DT_CREATED.add(days=6).date()) == "Done"
@@ -0,0 +1,142 @@
+"""Tests for sampling.py functions."""
+
+import csv
+import random
+
+import pendulum
+import pytest
+from click.testing import CliRunner
+
+from jiraport.issues import IssueSummary
+from jiraport import main
+from jiraport.sampling import estimate
+
+
+def _summary(dev_hours, blocked_hours=0):
+    return IssueSummary(
+        id="TEST-1",
+        status="Done",
+        story_points="",
+        time_blocked=pendulum.Duration(hours=blocked_hours),
+        time_dev=pendulum.Duration(hours=dev_hours),
+        date_created=None,
+        date_in_dev=None,
+        date_code_review=None,
+        date_done=None,
+    )
+
+
+def _by_key(estimates):
+    return {(e.metric, e.statistic): e for e in estimates}
+
+
+class TestEstimate:
+    def test_rounds_with_half_days(self):
+        # 1 hour and 30 hours round up to 0.5 and 1.5 days.
+        pages = [[_summary(1), _summary(30)]] * 3
+
+        estimates = _by_key(estimate(pages, rng=random.Random(0), resamples=50))
+
+        mean = estimates[("Days In Dev", "Mean")]
+        assert (mean.value, mean.low, mean.high) == (1.0, 1.0, 1.0)
+        assert estimates[("Days In Dev", "P90")].value == 1.5
+        assert estimates[("Days Blocked", "Median")].value == 0.0
+
+    def test_interval_contains_estimate(self):
+        rng = random.Random(1)
+        pages = [[_summary(rng.randint(1, 200)) for _ in range(10)] for _ in range(20)]
+
+        for e in estimate(pages, rng=rng, resamples=200):
+            assert e.low <= e.value <= e.high
+
+    def test_single_page_resamples_issues(self):
+        pages = [[_summary(hours) for hours in range(1, 200, 10)]]
+
+        for e in estimate(pages, rng=random.Random(0), resamples=200):
+            if e.metric == "Days In Dev":
+                assert e.low is not None and e.high is not None
+                assert e.low < e.high
+
+    def test_single_issue_has_no_interval(self):
+        estimates = estimate([[_summary(30)]], rng=random.Random(0))
+
+        assert all(e.low is None and e.high is None for e in estimates)
+        assert _by_key(estimates)[("Days In Dev", "Mean")].value == 1.5
+
+    def test_empty_sample(self):
+        assert estimate([[], []], rng=random.Random(0)) == []
+
+
+class TestSummarizeSample:
+    @pytest.fixture
+    def run(self, mock_jira_client, monkeypatch, tmp_path):
+        def page(jql, startAt=0, maxResults=50, **kwargs):
+            end = min(startAt + maxResults, 100)
+            return {
+                "startAt": startAt,
+                "total": 100,
+                "issues": [_issue_json(n) for n in range(startAt, end)],
+            }
+
+        mock_jira_client.search_issues.side_effect = page
+        monkeypatch.setattr(main, "_jira_connect", lambda **kwargs: mock_jira_client)
+        monkeypatch.chdir(tmp_path)
+
+        def run(*args):
+            return CliRunner().invoke(
+                main.cli, ["summarize", "--sample", "40", "--seed", "1", *args]
+            )
+
+        return run
+
+    def test_writes_estimates_csv(self, run, tmp_path):
+        result = run("-o", "csv")
+
+        assert result.exit_code == 0, result.output
+        assert "CSV output written to output.csv" in result.output
+        with open(tmp_path / "output.csv") as file:
+            rows = list(csv.DictReader(file))
+        assert [(row["Metric"], row["Statistic"]) for row in rows][:3] == [
+            ("Days In Dev", "Mean"),
+            ("Days In Dev", "Median"),
+            ("Days In Dev", "P90"),
+        ]
+
+    def test_table_only(self, run, tmp_path):
+        result = run("-o", "table")
+
+        assert result.exit_code == 0, result.output
+        assert "Estimates from 40 of 100 Issues" in result.output
+        assert not (tmp_path / "output.csv").exists()
+
+
+def _issue_json(n):
+    created = pendulum.datetime(2025, 1, 1, 12)
+    return {
+        "key": f"TEST-{n}",
+        "fields": {"created": created.to_iso8601_string(), "status": {"name": "Done"}},
+        "changelog": {
+            "histories": [
+                {
+                    "created": created.add(hours=10 + n).to_iso8601_string(),
+                    "items": [
+                        {
+                            "field": "status",
+                            "fromString": "To Do",
+                            "toString": "Development",
+                        }
+                    ],
+                },
+                {
+                    "created": created.add(hours=40 + 3 * n).to_iso8601_string(),
+                    "items": [
+                        {
+                            "field": "status",
+                            "fromString": "Development",
+                            "toString": "Done",
+                        }
+                    ],
+                },
+            ]
+        },
+    }
@@ -0,0 +1,129 @@
+"""Tests for search.py functions."""
+
+import random
+
+import pytest
+
+from jiraport.search import SearchError, count, sample_pages, search_raw
+
+
+def _issue(n):
+    return {
+        "key": f"TEST-{n}",
+        "fields": {
+            "created": "2025-01-01T00:00:00.000+0000",
+            "status": {"name": "Done"},
+        },
+        "changelog": {"histories": []},
+    }
+
+
+def _page(start_at, count, total):
+    return {
+        "startAt": start_at,
+        "maxResults": count,
+        "total": total,
+        "issues": [_issue(n) for n in range(start_at, min(start_at + count, total))],
+    }
+
+
+class TestSearchRaw:
+    def test_follows_offset_pages(self, mock_jira_client):
+        mock_jira_client.search_issues.side_effect = (
+            lambda jql, startAt=0, maxResults=50, **kwargs: _page(startAt, 2, 5)
+        )
+
+        issues = search_raw(mock_jira_client, "project = TEST", page_size=2)
+
+        assert [issue.key for issue in issues] == [f"TEST-{n}" for n in range(5)]
+        assert [
+            call.kwargs.get("startAt", 0)
+            for call in mock_jira_client.search_issues.call_args_list
+        ] == [0, 2, 4]
+
+    def test_stops_at_limit(self, mock_jira_client):
+        mock_jira_client.search_issues.side_effect = (
+            lambda jql, startAt=0, maxResults=50, **kwargs: _page(
+                startAt, maxResults, 50
+            )
+        )
+
+        issues = search_raw(mock_jira_client, "project = TEST", limit=3, page_size=2)
+
+        assert [issue.key for issue in issues] == ["TEST-0", "TEST-1", "TEST-2"]
+        assert mock_jira_client.search_issues.call_count == 2
+
+    def test_does_not_fetch_past_limit(self, mock_jira_client):
+        mock_jira_client.search_issues.side_effect = (
+            lambda jql, startAt=0, maxResults=50, **kwargs: _page(
+                startAt, maxResults, 50
+            )
+        )
+
+        issues = search_raw(mock_jira_client, "project = TEST", limit=10)
+
+        assert len(issues) == 10
+        assert mock_jira_client.search_issues.call_count == 1
+
+    def test_follows_next_page_tokens(self, mock_jira_client):
+        mock_jira_client.search_issues.return_value = {
+            "issues": [_issue(0)],
+            "nextPageToken": "a",
+        }
+        mock_jira_client.enhanced_search_issues.side_effect = [
+            {"issues": [_issue(1)], "nextPageToken": "b"},
+            {"issues": [_issue(2)], "isLast": True},
+        ]
+
+        issues = search_raw(mock_jira_client, "project = TEST")
+
+        assert [issue.key for issue in issues] == ["TEST-0", "TEST-1", "TEST-2"]
+        assert [
+            call.kwargs["nextPageToken"]
+            for call in mock_jira_client.enhanced_search_issues.call_args_list
+        ] == ["a", "b"]
+
+
+class TestSample:
+    def test_count(self, mock_jira_client):
+        mock_jira_client.search_issues.return_value = _page(0, 1, 1234)
+
+        assert count(mock_jira_client, "project = TEST") == 1234
+
+    def test_count_without_total(self, mock_jira_client):
+        mock_jira_client.search_issues.return_value = {"issues": []}
+
+        with pytest.raises(SearchError):
+            count(mock_jira_client, "project = TEST")
+
+    @pytest.fixture
+    def paged_client(self, mock_jira_client):
+        mock_jira_client.search_issues.side_effect = (
+            lambda jql, startAt=0, maxResults=50, **kwargs: _page(
+                startAt, maxResults, 1000
+            )
+        )
+        return mock_jira_client
+
+    def _start_ats(self, client):
+        return [call.kwargs["startAt"] for call in client.search_issues.call_args_list]
+
+    def test_sample_pages(self, paged_client):
+        pages = sample_pages(
+            paged_client, "project = TEST", 1000, 300, rng=random.Random(0)
+        )
+
+        start_ats = self._start_ats(paged_client)
+        assert len(pages) == 30
+        assert all(len(page) == 10 for page in pages)
+        assert start_ats == sorted(set(start_ats))
+        assert all(start_at % 10 == 0 for start_at in start_ats)
+
+    def test_small_sample_spans_single_issue_pages(self, paged_client):
+        pages = sample_pages(
+            paged_client, "project = TEST", 1000, 5, rng=random.Random(0)
+        )
+
+        assert len(pages) == 5
+        assert all(len(page) == 1 for page in pages)
+        assert len(set(self._start_ats(paged_client))) == 5
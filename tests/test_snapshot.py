@@ -0,0 +1,242 @@
+"""Tests for snapshot.py."""
+
+import pendulum
+import pytest
+from click.testing import CliRunner
+
+from jiraport import main, snapshot
+from jiraport.issues import status_on
+from jiraport.main import cli
+from jiraport.snapshot import SnapshotError, StatusMatrix
+from .factories import IssueFactory, MockChangelog, MockHistory, MockHistoryItem
+
+DT_CREATED = pendulum.datetime(2025, 1, 1)
+START = DT_CREATED.date()
+NO_CREDENTIALS = {"JIRA_SERVER": None, "JIRA_EMAIL": None, "JIRA_TOKEN": None}
+
+
+def _issue(key, *changes, created=DT_CREATED):
+    return IssueFactory(
+        key=key,
+        created=created.to_iso8601_string(),
+        changelog=MockChangelog(
+            [
+                MockHistory(
+                    created=DT_CREATED.add(days=days).to_iso8601_string(),
+                    items=[MockHistoryItem("status", from_status, to_status)],
+                )
+                for days, from_status, to_status in changes
+            ]
+        ),
+    )
+
+
+@pytest.fixture
+def issues():
+    return [
+        _issue("TEST-1", (1, "To Do", "Development"), (3, "Development", "Done")),
+        _issue("TEST-2", (2, "To Do", "Blocked")),
+        _issue("TEST-3"),
+    ]
+
+
+@pytest.fixture
+def matrix(tmp_path, issues):
+    matrix = StatusMatrix.create(tmp_path, "project = TEST", START)
+    matrix.update(issues, START.add(days=4))
+    yield matrix
+    matrix.close()
+
+
+class TestStatusMatrix:
+    def test_history_matches_status_on(self, matrix, issues):
+        for issue in issues:
+            assert matrix.history(issue.key) == [
+                status_on(issue, date) for date in matrix.dates()
+            ]
+
+    def test_counts(self, matrix):
+        assert matrix.counts(0) == {"Created": 3}
+        assert matrix.counts(1) == {"Created": 2, "Development": 1}
+        assert matrix.counts(4) == {"Created": 1, "Done": 1, "Blocked": 1}
+
+    def test_counts_skip_issues_not_yet_created(self, tmp_path):
+        # Noon UTC keeps these on the same calendar day in New York.
+        created = pendulum.datetime(2025, 1, 3, 12)
+        late = _issue("TEST-9", (3, "To Do", "Development"), created=created)
+
+        with StatusMatrix.create(tmp_path, "project = TEST", START) as matrix:
+            matrix.update([_issue("TEST-1"), late], START.add(days=4))
+
+            assert matrix.counts(0) == {"Created": 1}
+            assert matrix.counts(2) == {"Created": 2}
+            assert matrix.history("TEST-9") == [
+                "",
+                "",
+                "Created",
+                "Development",
+                "Development",
+            ]
+
+    def test_reopen(self, matrix, tmp_path):
+        matrix.close()
+
+        with StatusMatrix.open(tmp_path) as reopened:
+            assert reopened.days == 5
+            assert reopened.keys == ["TEST-1", "TEST-2", "TEST-3"]
+            assert reopened.history("TEST-1")[-1] == "Done"
+
+    def test_extend_with_new_days_and_issues(self, matrix, tmp_path, issues):
+        matrix.close()
+        new_issue = _issue("TEST-4", (6, "To Do", "QA"))
+
+        with StatusMatrix.open(tmp_path) as reopened:
+            # TEST-3 dropped out of the results, so its new days are unknown.
+            reopened.update([issues[0], issues[1], new_issue], START.add(days=7))
+
+            assert reopened.days == 8
+            assert reopened.history("TEST-3") == ["Created"] * 5 + [""] * 3
+            assert reopened.history("TEST-4") == ["Created"] * 6 + ["QA"] * 2
+            assert reopened.counts(7) == {"Done": 1, "Blocked": 1, "QA": 1}
+
+    def test_grows_capacity(self, tmp_path, monkeypatch, issues):
+        monkeypatch.setattr(snapshot, "MIN_CAPACITY", 2)
+
+        with StatusMatrix.create(tmp_path, "project = TEST", START) as matrix:
+            matrix.update(issues, START.add(days=4))
+
+            assert matrix.capacity == 4
+            for issue in issues:
+                assert matrix.history(issue.key) == [
+                    status_on(issue, date) for date in matrix.dates()
+                ]
+
+    def test_widening_replaces_matrix(self, tmp_path, monkeypatch, issues):
+        monkeypatch.setattr(snapshot, "MIN_CAPACITY", 2)
+
+        with StatusMatrix.create(tmp_path, "project = TEST", START) as matrix:
+            matrix.update(issues[:2], START.add(days=4))
+            matrix.update(issues, START.add(days=4))
+
+        assert sorted(p.name for p in tmp_path.glob("*.bin")) == ["matrix-4.bin"]
+        with StatusMatrix.open(tmp_path) as reopened:
+            assert reopened.capacity == 4
+            assert reopened.history("TEST-1")[-1] == "Done"
+
+    def test_interrupted_update_keeps_indexed_days(
+        self, matrix, tmp_path, monkeypatch, issues
+    ):
+        matrix.close()
+        # TEST-4's "QA" is one status too many, after the days were appended.
+        monkeypatch.setattr(snapshot, "MAX_STATUSES", len(matrix.statuses))
+        new_issue = _issue("TEST-4", (6, "To Do", "QA"))
+
+        with StatusMatrix.open(tmp_path) as reopened:
+            with pytest.raises(SnapshotError):
+                reopened.update([*issues, new_issue], START.add(days=7))
+
+        with StatusMatrix.open(tmp_path) as reopened:
+            assert reopened.days == 5
+            assert reopened.keys == ["TEST-1", "TEST-2", "TEST-3"]
+            assert reopened.history("TEST-1")[-1] == "Done"
+
+            reopened.update(issues, START.add(days=7))
+            assert reopened.history("TEST-3") == ["Created"] * 8
+
+    def test_interrupted_widening_keeps_old_matrix(self, tmp_path, monkeypatch, issues):
+        monkeypatch.setattr(snapshot, "MIN_CAPACITY", 2)
+
+        with StatusMatrix.create(tmp_path, "project = TEST", START) as matrix:
+            matrix.update(issues[:2], START.add(days=4))
+
+            def fail(*args):
+                raise OSError("disk full")
+
+            monkeypatch.setattr(snapshot, "_write_index", fail)
+            with pytest.raises(OSError):
+                matrix.update(issues, START.add(days=4))
+
+        with StatusMatrix.open(tmp_path) as reopened:
+            assert reopened.capacity == 2
+            assert reopened.keys == ["TEST-1", "TEST-2"]
+            assert reopened.history("TEST-1")[-1] == "Done"
+
+    def test_unknown_key(self, matrix):
+        with pytest.raises(SnapshotError):
+            matrix.history("NOPE-1")
+
+    def test_open_missing(self, tmp_path):
+        with pytest.raises(SnapshotError):
+            StatusMatrix.open(tmp_path / "missing")
+
+
+class TestSnapshotCommands:
+    @pytest.fixture
+    def run(self, matrix, tmp_path):
+        matrix.close()
+        # Queries read the snapshot only, so they must work without credentials.
+        env = {**NO_CREDENTIALS, "COLUMNS": "200"}
+
+        def run(*args):
+            return CliRunner().invoke(
+                cli, ["snapshot", *args, "--path", str(tmp_path)], env=env
+            )
+
+        return run
+
+    def test_counts(self, run):
+        result = run("counts", "--start", "01/02/2025", "--end", "01/03/2025")
+
+        assert result.exit_code == 0, result.output
+        assert "01/02/2025" in result.output
+        assert "01/03/2025" in result.output
+        assert "01/01/2025" not in result.output
+        assert "Development" in result.output
+
+    def test_history(self, run):
+        result = run("history", "TEST-1")
+
+        assert result.exit_code == 0, result.output
+        assert "Created" in result.output
+        assert "Development" in result.output
+        assert "Done" in result.output
+
+    def test_history_unknown_key(self, run):
+        result = run("history", "NOPE-1")
+
+        assert result.exit_code == 1
+        assert "NOPE-1 is not in the snapshot" in result.output
+
+    def test_missing_snapshot(self, run, tmp_path):
+        result = CliRunner().invoke(
+            cli,
+            ["snapshot", "counts", "--path", str(tmp_path / "missing")],
+            env=NO_CREDENTIALS,
+        )
+
+        assert result.exit_code == 1
+        assert "No snapshot found" in result.output
+
+    def test_update_requires_credentials(self, tmp_path):
+        path = tmp_path / "new"
+        result = CliRunner().invoke(
+            cli,
+            ["snapshot", "update", "--start", "01/01/2025", "--path", str(path)],
+            env=NO_CREDENTIALS,
+        )
+
+        assert result.exit_code == 2
+        assert "Missing option(s): --server, --email, --token" in result.output
+        assert not path.exists()
+
+    def test_update_reports_snapshot_errors(self, run, monkeypatch):
+        monkeypatch.setattr(snapshot, "MAX_STATUSES", 5)
+        monkeypatch.setattr(main, "_jira_connect", lambda **kwargs: None)
+        monkeypatch.setattr(
+            main, "search_raw", lambda j, jql: [_issue("TEST-4", (6, "To Do", "QA"))]
+        )
+
+        result = run("update", "--end", "01/08/2025")
+
+        assert result.exit_code == 1
+        assert "Too many statuses; cannot add 'QA'" in result.output